@@ -1,10 +1,11 @@
 from pathlib import Path
+import json
 import yaml
 from lettersmith.path import glob_all
 
 
-YAML_EXT = (".yaml", ".yml")
-JSON_EXT = (".json")
+YAML_EXT = frozenset((".yaml", ".yml"))
+JSON_EXT = frozenset((".json",))
 
 
 def _smart_read_data_file(file_path):
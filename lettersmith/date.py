@@ -19,15 +19,28 @@ def read_file_times(pathlike):
         return EPOCH, EPOCH
 
 
-@singledispatch
 def to_datetime(x):
     """
     Given a date or datetime, return a datetime.
     Used to read datetime values from meta fields.
+
+    Datetimes are returned as-is, without going through type dispatch,
+    since this is called for every doc created. Other types are
+    dispatched by type. Use `to_datetime.register` to support more types.
     """
+    if type(x) is datetime:
+        return x
+    return _to_datetime(x)
+
+
+@singledispatch
+def _to_datetime(x):
     raise TypeError("read function not implemented for type {}".format(type(x)))
 
 
+to_datetime.register = _to_datetime.register
+
+
 @to_datetime.register(datetime)
 def datetime_to_datetime(dt):
     return dt
@@ -1,7 +1,8 @@
 """
 Tools for working with collections of docs
 """
-from fnmatch import fnmatch
+from heapq import nlargest
+from pathlib import PurePath
 from lettersmith import path as pathtools
 from lettersmith import doc as Doc
 from lettersmith import query
@@ -39,8 +40,9 @@ def matching(docs, glob):
     Filter an iterator of docs to only those docs whos id_path
     matches a unix-style glob pattern.
     """
+    match = pathtools.glob_matcher(glob)
     for doc in docs:
-        if fnmatch(doc.id_path, glob):
+        if match(doc.id_path):
             yield doc
 
 
@@ -51,8 +53,10 @@ def filter_siblings(docs, id_path):
     yielding only those dicts who's id_path is a sibling to
     `id_path`.
     """
+    parent = PurePath(id_path).parent
     for doc in docs:
-        if pathtools.is_sibling(id_path, doc.id_path):
+        doc_path = PurePath(doc.id_path)
+        if doc_path.parent == parent and doc_path.stem != "index":
             yield doc
 
 
@@ -70,11 +74,13 @@ with_ext_html = query.maps(Doc.with_ext_html)
 def most_recent(n):
     """
     Get most recent `n` docs, ordered by created.
+
+    Selects the top `n` with a heap, rather than sorting every doc,
+    so it stays cheap for large collections.
     """
-    return compose(
-        query.takes(n),
-        sort_by_created
-    )
+    def most_recent_bound(docs):
+        return nlargest(n, docs, key=Doc.created.get)
+    return most_recent_bound
 
 
 def with_template(template):
@@ -11,17 +11,31 @@ def id(x):
     return x
 
 
-def _compose2(b, a):
-    """Compose 2 functions"""
+def _compose_ltr(funcs):
+    """
+    Compose a tuple of functions, applied left to right.
+
+    Calls each function in a single loop, rather than nesting a closure
+    per function, so calling the result only costs one extra frame,
+    however many functions are composed.
+    """
+    if len(funcs) == 0:
+        return id
+
     def composed(x):
         """Composed function"""
-        return b(a(x))
+        for func in funcs:
+            x = func(x)
+        return x
+
+    # Keep the composed functions around for introspection.
+    composed.funcs = funcs
     return composed
 
 
 def compose(*funcs):
     """Compose n functions from right to left"""
-    return reduce(_compose2, funcs, id)
+    return _compose_ltr(tuple(reversed(funcs)))
 
 
 def thrush(*funcs):
@@ -39,7 +53,7 @@ def thrush(*funcs):
     It's named after
     https://en.wikipedia.org/wiki/To_Mock_a_Mockingbird
     """
-    return reduce(_compose2, reversed(funcs), id)
+    return _compose_ltr(funcs)
 
 
 def _apply_to(value, func):
@@ -58,7 +58,7 @@ def _tokenize(lines):
     """
     for line in lines:
         line_clean = line.strip()
-        if line_clean is "":
+        if line_clean == "":
             pass
         elif line.startswith("  "):
             yield Token("html", line_clean)
@@ -73,9 +73,9 @@ def _render_token(token):
     Render HTML tokens. This markup language is very simple, so we only
     have two.
     """
-    if token.type is "html":
+    if token.type == "html":
         return token.body
-    elif token.type is "p":
+    elif token.type == "p":
         return "<p>{}</p>".format(token.body)
     else:
         raise RenderError("Unknown token type {}".format(token.type))
@@ -86,7 +86,7 @@ def render_html(text):
     Renders text as HTML.
     """
     lines = text.splitlines()
-    return "\n".join(_render_token(token) for token in _tokenize(lines))
+    return "\n".join([_render_token(token) for token in _tokenize(lines)])
 
 
 content = Docs.renderer(render_html)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import random
 import itertools
+from collections.abc import Sequence
 from datetime import datetime
 
 from jinja2 import Environment, FileSystemLoader
@@ -13,8 +14,16 @@ from lettersmith import path as pathtools
 from lettersmith.markdowntools import markdown
 
 
+def _as_sequence(iterable):
+    """
+    Collect an iterable into a tuple, unless it is already a sequence.
+    `random` copies what it needs, so sequences are not copied twice.
+    """
+    return iterable if isinstance(iterable, Sequence) else tuple(iterable)
+
+
 def _choice(iterable):
-    return random.choice(tuple(iterable))
+    return random.choice(_as_sequence(iterable))
 
 
 def _shuffle(iterable):
@@ -25,7 +34,7 @@ def _shuffle(iterable):
     This prevents annoying in-template errors, where collecting
     an iterator into a tuple can be non-trivial.
     """
-    t = tuple(iterable)
+    t = _as_sequence(iterable)
     return random.sample(t, k=len(t))
 
 
@@ -35,11 +44,11 @@ def _sample(iterable, k):
     This prevents annoying in-template errors, where collecting
     an iterator into a tuple can be non-trivial.
     """
-    l = list(iterable)
+    t = _as_sequence(iterable)
     try:
-        return random.sample(l, k)
+        return random.sample(t, k)
     except ValueError:
-        return l
+        return list(t)
 
 
 def _permalink(base_url):
@@ -49,11 +58,13 @@ def _permalink(base_url):
 
 
 class FileSystemEnvironment(Environment):
-    def __init__(self, templates_path, filters={}, context={}):
+    def __init__(self, templates_path, filters=None, context=None):
         loader = FileSystemLoader(templates_path)
         super().__init__(loader=loader)
-        self.filters.update(filters)
-        self.globals.update(context)
+        if filters is not None:
+            self.filters.update(filters)
+        if context is not None:
+            self.globals.update(context)
 
 
 TEMPLATE_FUNCTIONS = {
@@ -74,25 +85,30 @@ class LettersmithEnvironment(FileSystemEnvironment):
     Specialized version of default Jinja environment class that
     offers additional filters and environment variables.
     """
-    def __init__(self, templates_path, filters={}, context={}):
-        loader = FileSystemLoader(templates_path)
+    def __init__(self, templates_path, filters=None, context=None):
         super().__init__(
             templates_path,
-            filters=TEMPLATE_FUNCTIONS,
-            context=TEMPLATE_FUNCTIONS
+            filters=(
+                {**TEMPLATE_FUNCTIONS, **filters}
+                if filters is not None
+                else TEMPLATE_FUNCTIONS
+            ),
+            context=(
+                {**TEMPLATE_FUNCTIONS, **context}
+                if context is not None
+                else TEMPLATE_FUNCTIONS
+            )
         )
-        self.filters.update(filters)
-        self.globals.update(context)
 
 
 def should_template(doc):
     """
     Check if a doc should be templated. Returns a bool.
     """
-    return get(Doc.template, doc) is not ""
+    return get(Doc.template, doc) != ""
 
 
-def jinja(templates_path, base_url, context={}, filters={}):
+def jinja(templates_path, base_url, context=None, filters=None):
     """
     Wraps up the gory details of creating a Jinja renderer.
     Returns a render function that takes a doc and returns a rendered doc.
@@ -100,6 +116,8 @@ def jinja(templates_path, base_url, context={}, filters={}):
     Lettersmith default filters and globals.
     """
     now = datetime.now()
+    filters = filters if filters is not None else {}
+    context = context if context is not None else {}
     env = LettersmithEnvironment(
         templates_path,
         filters={"permalink": _permalink(base_url), **filters},
@@ -48,7 +48,24 @@ def lens_compose(big_lens, *smaller_lenses):
     """
     Compose many lenses
     """
-    return reduce(_lens_compose2, smaller_lenses, big_lens)
+    if len(smaller_lenses) == 0:
+        return big_lens
+
+    composed = reduce(_lens_compose2, smaller_lenses, big_lens)
+    getters = tuple(lens.get for lens in (big_lens, *smaller_lenses))
+
+    def get(big):
+        """
+        Lens `get` method (composed)
+
+        Walks the getters in a single loop, rather than going through
+        a nested `get` for each composed lens.
+        """
+        for getter in getters:
+            big = getter(big)
+        return big
+
+    return Lens(get, composed.put)
 
 
 def get(lens, big):
@@ -1,5 +1,8 @@
 from urllib.parse import urlparse, urljoin
 from pathlib import Path, PurePath
+from fnmatch import translate
+from functools import lru_cache
+from os.path import normcase
 import re
 from lettersmith.func import compose
 from lettersmith.lens import Lens, put
@@ -7,17 +10,20 @@ from lettersmith import query
 
 
 _STRANGE_CHARS = "[](){}<>:^&%$#@!'\"|*~`,"
-_STRANGE_CHAR_PATTERN = "[{}]".format(re.escape(_STRANGE_CHARS))
+_STRANGE_CHAR_PATTERN = re.compile("[{}]".format(re.escape(_STRANGE_CHARS)))
+_SPACE_PATTERN = re.compile(r"\s+")
+_BASE_SLASH_PATTERN = re.compile("^/")
+_DRAFT_PATTERN = re.compile(r'^_')
 
 
 def _space_to_dash(text):
     """Replace spaces with dashes."""
-    return re.sub(r"\s+", "-", text)
+    return _SPACE_PATTERN.sub("-", text)
 
 
 def _remove_strange_chars(text):
     """Remove funky characters that don't belong in a URL."""
-    return re.sub(_STRANGE_CHAR_PATTERN, "", text)
+    return _STRANGE_CHAR_PATTERN.sub("", text)
 
 
 def _lower(s):
@@ -80,7 +86,7 @@ def qualify_url(pathlike, base="/"):
 
 def remove_base_slash(any_path):
     """Remove base slash from a path."""
-    return re.sub("^/", "", any_path)
+    return _BASE_SLASH_PATTERN.sub("", any_path)
 
 
 def undraft(pathlike):
@@ -89,7 +95,7 @@ def undraft(pathlike):
     """
     path = PurePath(pathlike)
     if path.stem.startswith("_"):
-        return path.with_name(re.sub(r'^_', "", path.name))
+        return path.with_name(_DRAFT_PATTERN.sub("", path.name))
     else:
         return path
 
@@ -205,6 +211,62 @@ def is_sibling(path_a, path_b):
         and not is_index(path_b))
 
 
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _has_glob_chars(s):
+    return not _GLOB_CHARS.isdisjoint(s)
+
+
+def _match_any(s):
+    return True
+
+
+@lru_cache(maxsize=512)
+def _compile_glob(pattern):
+    """
+    Compile a unix-style glob pattern to a match function.
+
+    Most globs are literal paths, or a literal with a `*` at one or both
+    ends. Those are matched with plain string methods. Anything else
+    is translated to a regex.
+    """
+    if pattern == "*":
+        return _match_any
+    elif not _has_glob_chars(pattern):
+        return pattern.__eq__
+
+    head, tail = pattern.startswith("*"), pattern.endswith("*")
+    core = pattern[int(head):len(pattern) - int(tail)]
+    if _has_glob_chars(core):
+        return re.compile(translate(pattern)).match
+    elif head and tail:
+        return lambda s: core in s
+    elif tail:
+        return lambda s: s.startswith(core)
+    else:
+        return lambda s: s.endswith(core)
+
+
+_IS_CASE_SENSITIVE = normcase("A") == "A"
+
+
+def glob_matcher(glob):
+    """
+    Get a function that checks if a path string matches a unix-style
+    glob pattern, following the same rules as `fnmatch.fnmatch`.
+    The function returns a truthy value for a match.
+
+    Compiled matchers are cached and shared process-wide, so each
+    pattern is only compiled once, however many places use it.
+    The cache is thread-safe.
+    """
+    match = _compile_glob(normcase(glob))
+    if _IS_CASE_SENSITIVE:
+        return match
+    return lambda path_str: match(normcase(path_str))
+
+
 def filter_files(paths):
     """
     Given an iterable of paths, filter paths to just those which are
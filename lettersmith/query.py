@@ -1,7 +1,7 @@
 """
 Tools for querying data structures. Kind of a lightweight LINQ.
 """
-from itertools import islice
+from itertools import islice, filterfalse
 from random import sample
 
 
@@ -26,9 +26,7 @@ def rejects(predicate):
         """
         Reject items with bound predicate function.
         """
-        for item in iterable:
-            if not predicate(item):
-                yield item
+        return filterfalse(predicate, iterable)
     return reject_bound
 
 
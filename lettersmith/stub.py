@@ -25,14 +25,17 @@ Only hashable properties, so stubs can be used in sets.
 
 def from_doc(doc):
     """
-    Read stub from doc
+    Read stub from doc.
+
+    Reads doc fields directly, rather than through lenses, since this
+    gets called for every doc, link and taxonomy term.
     """
     return Stub(
-        get(Doc.id_path, doc),
-        get(Doc.output_path, doc),
-        get(Doc.created, doc),
-        get(Doc.modified, doc),
-        get(Doc.title, doc),
+        doc.id_path,
+        doc.output_path,
+        doc.created,
+        doc.modified,
+        doc.title,
         get(Doc.meta_summary, doc)
     )
 
@@ -80,11 +80,14 @@ def index_taxonomy(docs, key):
     """
     tax_index = {}
     for doc in docs:
-        if key in doc.meta:
-            for term in doc.meta[key]:
+        terms = doc.meta.get(key, _empty)
+        if terms:
+            # Read the stub once per doc, and share it across terms.
+            stub = Stub.from_doc(doc)
+            for term in terms:
                 if term not in tax_index:
                     tax_index[term] = []
-                tax_index[term].append(Stub.from_doc(doc))
+                tax_index[term].append(stub)
     return tax_index
 
 
@@ -3,6 +3,8 @@ Utility functions.
 Mostly tools for working with dictionaries and iterables.
 """
 from functools import wraps
+from itertools import islice
+from operator import itemgetter
 from fnmatch import fnmatch
 from collections import OrderedDict
 
@@ -12,13 +14,11 @@ def chunk(iterable, n):
     Split an iterable into chunks of size n.
     Returns an iterator of sequences.
     """
-    chunk = []
-    for x in iterable:
-        chunk.append(x)
-        if len(chunk) == n:
-            yield chunk
-            chunk = []
-    if len(chunk) > 0:
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, n))
+        if not chunk:
+            return
         yield chunk
 
 
@@ -30,8 +30,7 @@ def mix(d, e):
     return {**d, **e}
 
 
-def _first(pair):
-    return pair[0]
+_first = itemgetter(0)
 
 
 def order_dict_by_keys(d):
@@ -49,7 +48,10 @@ def join(words, sep="", template="{word}"):
     Join an iterable of strings, with optional template string defining
     how each word is to be templated before joining.
     """
-    return sep.join(template.format(word=word) for word in words)
+    if template == "{word}":
+        return sep.join(map(str, words))
+    format = template.format
+    return sep.join([format(word=word) for word in words])
 
 
 def expand(f, iter, *args, **kwargs):
@@ -11,7 +11,7 @@ from lettersmith import html
 from lettersmith import wikimarkup
 from lettersmith import markdowntools
 from lettersmith.path import to_slug, to_url
-from lettersmith.util import index_sets, expand
+from lettersmith.util import expand
 from lettersmith.lens import lens_compose, key, get, put, over
 from lettersmith.func import compose, composable
 from lettersmith.stringtools import first_sentence
@@ -80,12 +80,24 @@ def _collect_edges(docs):
     return expand(_expand_edges, docs, slug_to_stub)
 
 
-def _index_by_link(edge):
-    return edge.tail.id_path, edge.head
+def _add_to_index(index, key, value):
+    try:
+        index[key].add(value)
+    except KeyError:
+        index[key] = set((value,))
 
 
-def _index_by_backlink(edge):
-    return edge.head.id_path, edge.tail
+def _index_links(edges):
+    """
+    Index edges by link and by backlink in a single pass.
+    Returns a tuple of `(link_index, backlink_index)`.
+    """
+    link_index = {}
+    backlink_index = {}
+    for edge in edges:
+        _add_to_index(link_index, edge.tail.id_path, edge.head)
+        _add_to_index(backlink_index, edge.head.id_path, edge.tail)
+    return link_index, backlink_index
 
 
 _empty = tuple()
@@ -109,9 +121,7 @@ def annotate_links(docs):
     Each contains a tuple of `Stub`s.
     """
     docs = tuple(docs)
-    edges = tuple(_collect_edges(docs))
-    link_index = index_sets(_index_by_link(edge) for edge in edges)
-    backlink_index = index_sets(_index_by_backlink(edge) for edge in edges)
+    link_index, backlink_index = _index_links(_collect_edges(docs))
     empty = tuple()
     for doc in docs:
         backlinks = frozenset(backlink_index.get(doc.id_path, empty))
@@ -151,7 +161,7 @@ def content_wikilinks(
     slug_to_stub = _index_by_slug(docs)
 
     def render_wikilink(slug, title, type):
-        if type is "transclude":
+        if type == "transclude":
             try:
                 link = slug_to_stub[slug]
                 url = to_url(link.output_path, base=base_url)
@@ -0,0 +1,69 @@
+import unittest
+from lettersmith import doc as Doc
+from lettersmith import docs as Docs
+
+
+def _doc(id_path):
+    return Doc.create(id_path=id_path, output_path=id_path)
+
+
+class test_matching(unittest.TestCase):
+    def test_1(self):
+        docs = (
+            _doc("posts/a.md"),
+            _doc("posts/b.html"),
+            _doc("pages/c.md")
+        )
+        matched = tuple(Docs.matching("posts/*.md")(docs))
+        self.assertEqual(len(matched), 1)
+        self.assertEqual(matched[0].id_path, "posts/a.md")
+
+    def test_star(self):
+        docs = (_doc("posts/a.md"), _doc("pages/c.md"))
+        matched = tuple(Docs.matching("*")(docs))
+        self.assertEqual(len(matched), 2)
+
+    def test_literal(self):
+        docs = (_doc("posts/a.md"), _doc("posts/a.mdx"))
+        matched = tuple(Docs.matching("posts/a.md")(docs))
+        self.assertEqual(len(matched), 1)
+        self.assertEqual(matched[0].id_path, "posts/a.md")
+
+    def test_prefix_suffix(self):
+        docs = (_doc("posts/a.md"), _doc("pages/b.md"), _doc("posts/c.html"))
+        prefixed = tuple(Docs.matching("posts/*")(docs))
+        suffixed = tuple(Docs.matching("*.md")(docs))
+        infixed = tuple(Docs.matching("*/b*")(docs))
+        self.assertEqual(len(prefixed), 2)
+        self.assertEqual(len(suffixed), 2)
+        self.assertEqual(len(infixed), 1)
+
+
+class test_filter_siblings(unittest.TestCase):
+    def test_1(self):
+        docs = (
+            _doc("foo/bar/baz.html"),
+            _doc("foo/bar/bing.html"),
+            _doc("foo/bar/index.html"),
+            _doc("foo/bar/boing/index.html"),
+            _doc("foo/other.html")
+        )
+        siblings = tuple(
+            doc.id_path
+            for doc in Docs.filter_siblings("foo/bar/baz.html")(docs)
+        )
+        self.assertEqual(siblings, ("foo/bar/baz.html", "foo/bar/bing.html"))
+
+
+class test_most_recent(unittest.TestCase):
+    def test_1(self):
+        docs = tuple(
+            Doc.create(id_path=str(i), output_path=str(i), created=created)
+            for i, created in enumerate(("2019-01-02", "2019-01-03", "2019-01-01"))
+        )
+        recent = tuple(doc.id_path for doc in Docs.most_recent(2)(docs))
+        self.assertEqual(recent, ("1", "0"))
+
+
+if __name__ == '__main__':
+    unittest.main()
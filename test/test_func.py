@@ -17,6 +17,15 @@ class test_compose(unittest.TestCase):
         s = abc("_")
         self.assertEqual(s, "_abc")
 
+    def test_single(self):
+        def a(s):
+            return s + "a"
+
+        self.assertEqual(compose(a)("_"), "_a")
+
+    def test_empty(self):
+        self.assertEqual(compose()("_"), "_")
+
 
 class test_thrush(unittest.TestCase):
     def test_1(self):
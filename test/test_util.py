@@ -1,5 +1,36 @@
 import unittest
+from lettersmith.util import chunk, order_dict_by_keys, join
+
+
+class test_chunk(unittest.TestCase):
+    def test_1(self):
+        chunks = tuple(chunk(range(5), 2))
+        self.assertEqual(chunks, ([0, 1], [2, 3], [4]))
+
+    def test_even(self):
+        chunks = tuple(chunk(iter(range(4)), 2))
+        self.assertEqual(chunks, ([0, 1], [2, 3]))
+
+    def test_empty(self):
+        chunks = tuple(chunk((), 2))
+        self.assertEqual(chunks, ())
+
+
+class test_order_dict_by_keys(unittest.TestCase):
+    def test_1(self):
+        d = order_dict_by_keys({"b": 2, "c": 3, "a": 1})
+        self.assertEqual(tuple(d.keys()), ("a", "b", "c"))
+
+
+class test_join(unittest.TestCase):
+    def test_1(self):
+        s = join(("a", "b", 3), sep=", ")
+        self.assertEqual(s, "a, b, 3")
+
+    def test_template(self):
+        s = join(iter(("a", "b")), template="<{word}>")
+        self.assertEqual(s, "<a><b>")
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()